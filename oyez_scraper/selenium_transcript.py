@@ -3,17 +3,214 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import json
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import requests
+import requests_cache
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import orjson
+import logging
+import os
+import re
+import threading
 import time
 
-def get_case_metadata(driver, case_year, case_name):
+logger = logging.getLogger(__name__)
+
+OYEZ_API = 'https://api.oyez.org'
+PLAYER_URL = 'https://apps.oyez.org/player/'
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# On-disk cache so reruns don't hit Oyez again. CACHE_MAX_AGE (seconds) applies
+# to both the HTTP responses and the scraped transcripts.
+CACHE_DIR = '.oyez_cache'
+TRANSCRIPT_CACHE_DIR = os.path.join(CACHE_DIR, 'transcripts')
+CACHE_MAX_AGE = 86400
+
+# Selenium locators; the CSS part is also passed to the bulk execute_script calls
+CASE_ITEMS_SEL = (By.CSS_SELECTOR, 'li[ng-repeat*="case in pager.content"]')
+CASE_DETAILS_SEL = (By.CSS_SELECTOR, 'div.row:first-child h3')
+BLOCKS_SEL = (By.CSS_SELECTOR, 'p.ng-binding.ng-scope.ng-isolate-scope')
+SPEAKER_SEL = (By.CSS_SELECTOR, 'h4.ng-binding')
+
+# Selectors for the parsed case details page, compiled once to XPath
+PARTIES_SEL = CSSSelector('div.row:first-child')
+PETITIONER_XPATH = etree.XPath(".//div[h3[text()='Petitioner']]")
+RESPONDENT_XPATH = etree.XPath(".//div[h3[text()='Respondent']]")
+DOCKET_NO_XPATH = etree.XPath("//div[h3[text()='Docket no.']]/text()")
+DECIDED_BY_XPATH = etree.XPath("//div[h3[text()='Decided by']]//a")
+LOWER_COURT_XPATH = etree.XPath("//div[h3[text()='Lower court']]")
+ADVOCATES_SEL = CSSSelector('div.subcell[ng-if="case.advocates"] .advocate')
+LINK_SEL = CSSSelector('a')
+DESCRIPTION_SEL = CSSSelector('.description')
+FACTS_SEL = CSSSelector('section.abstract[ng-if="case.facts_of_the_case"] div.ng-binding p')
+QUESTION_SEL = CSSSelector('section.abstract[ng-if="case.question"] div.ng-binding p')
+CONCLUSION_SEL = CSSSelector('section.abstract div[ng-if="case.conclusion"] p')
+ORAL_ARG_SEL = CSSSelector('a[data-gtm-category="Audios"][data-gtm-type="click"][iframe-url*="oral_argument_audio"]')
+ORAL_ARG_FALLBACK_SEL = CSSSelector('a[iframe-url*="oral_argument_audio"]')
+CELL_SEL = CSSSelector('div.cell')
+SUBCELL_SEL = CSSSelector('div.subcell')
+CITATION_SEL = CSSSelector('div.subcell[ng-if="case.citation"] span.ng-binding')
+TIMELINE_ITEMS_SEL = CSSSelector('div.subcell.ng-binding.ng-scope')
+TIMELINE_HEADER_SEL = CSSSelector('h3')
+TIMELINE_DATE_SEL = CSSSelector('div.ng-binding.ng-scope')
+
+# Pause (seconds) before each case in scrape_cases, to stay polite to Oyez
+REQUEST_DELAY = 0.1
+
+# Number of page scrapes a reused Chrome instance runs before it is restarted,
+# to cap its memory growth
+DRIVER_RECYCLE_AFTER = 200
+
+# Resources Chrome doesn't need to fetch; none of them affect the elements we read
+BLOCKED_URLS = [
+    '*.jpg', '*.png', '*.gif', '*.webp', '*.woff*',
+    '*.mp3', '*.mp4', '*.m4a',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*'
+]
+
+def make_session(pool_maxsize=20, expire_after=CACHE_MAX_AGE):
+    """
+    Creates a cached requests Session for the Oyez API with a pooled adapter
+    and a browser-like User-Agent, so repeated calls reuse connections and
+    repeated runs are served from the on-disk cache. Failed GETs (connection
+    errors, 429 and 5xx responses) are retried with exponential backoff,
+    honouring Retry-After.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    session = requests_cache.CachedSession(
+        cache_name=os.path.join(CACHE_DIR, 'http'),
+        backend='sqlite',
+        expire_after=expire_after
+    )
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods={'GET'}
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Returns the shared Session, creating it (and the on-disk cache) on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+    return _session
+
+def _html_to_text(fragment):
+    """Converts an Oyez HTML fragment (e.g. facts_of_the_case) to plain paragraphs."""
+    if not fragment or not fragment.strip():
+        return None
+    paragraphs = []
+    for part in lxml.html.fragments_fromstring(fragment):
+        # Top-level text comes back as a leading string or as element tails
+        if isinstance(part, str):
+            paragraphs.append(' '.join(part.split()))
+            continue
+        # Comments (e.g. Word's <!--[if gte mso 9]>) and processing
+        # instructions have no text of their own, only a tail
+        if isinstance(part.tag, str):
+            paragraphs.append(_element_text(part))
+        paragraphs.append(' '.join((part.tail or '').split()))
+    return '\n\n'.join(p for p in paragraphs if p) or None
+
+def _format_date(timestamp):
+    """Formats an Oyez timeline timestamp the way the website shows it (e.g. "Oct 4, 2023")."""
+    date = datetime.fromtimestamp(timestamp, timezone.utc)
+    return f"{date:%b} {date.day}, {date.year}"
+
+def _to_seconds(value):
+    """Block start/stop time as a float number of seconds (the page has strings, the API numbers)."""
+    if value is None or value == '':
+        return None
+    return float(value)
+
+def _transcript_cache_path(case_year, docket_no, mode_suffix):
+    return os.path.join(TRANSCRIPT_CACHE_DIR, f'{case_year}_{docket_no}{mode_suffix}.json')
+
+def load_cached_transcript(case_year, docket_no, mode_suffix, max_age=CACHE_MAX_AGE):
+    """Returns the cached transcript list, or None if it is missing or older than max_age seconds."""
+    path = _transcript_cache_path(case_year, docket_no, mode_suffix)
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def save_cached_transcript(case_year, docket_no, mode_suffix, transcript):
+    os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+    with open(_transcript_cache_path(case_year, docket_no, mode_suffix), 'wb') as f:
+        f.write(orjson.dumps(transcript))
+
+# Tags whose content starts on its own line, as in Selenium's element.text
+LINE_BREAK_TAGS = {'br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+def _element_text(element):
+    """
+    Text of an lxml element with whitespace collapsed, like Selenium's element.text:
+    <br>, list items and other block elements become line breaks, comments are skipped.
     """
-    Scrapes metadata for a Supreme Court case from Oyez.org
+    parts = []
+    
+    def collect(node):
+        is_element = isinstance(node.tag, str)
+        if is_element and node.tag in LINE_BREAK_TAGS:
+            parts.append('\n')
+        if is_element and node.text:
+            parts.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+        if is_element and node.tag in LINE_BREAK_TAGS:
+            parts.append('\n')
+    
+    collect(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+def _print_metadata(metadata):
+    print("\nMetadata found:")
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            print(f"\n{key}:")
+            for item in value:
+                print(f"  - {item}")
+        else:
+            print(f"{key}: {value}")
+
+def get_case_metadata(driver, case_year, case_name, force_refresh=False):
+    """
+    Gets metadata for a Supreme Court case from Oyez.org
+    
+    The Oyez JSON API is queried first. If it cannot be reached and a
+    driver is given, the metadata is scraped from the website instead.
     
     Args:
-        driver: Selenium WebDriver instance
+        driver: Selenium WebDriver instance, or a function returning one so
+                Chrome is only started when needed; only used as a fallback (may be None)
         case_year: Year of the case (e.g., "2023")
         case_name: Partial name of the case (e.g., "Acheson")
+        force_refresh: If True, bypasses the HTTP cache and re-fetches from Oyez
     
     Returns:
         dict: Case metadata including:
@@ -28,190 +225,525 @@ def get_case_metadata(driver, case_year, case_name):
             - oral_argument_url: URL to oral argument
             - timeline dates (granted, argued, decided)
     """
+    try:
+        return get_case_metadata_from_api(case_year, case_name, force_refresh=force_refresh)
+    except requests.RequestException as e:
+        if driver is None:
+            raise
+        print(f"Oyez API request failed ({e}), falling back to page scraping...")
+        if callable(driver):
+            driver = driver()
+        return get_case_metadata_from_page(driver, case_year, case_name)
+
+def get_case_metadata_from_api(case_year, case_name, session=None, force_refresh=False):
+    """
+    Gets metadata for a Supreme Court case from the Oyez JSON API
+    
+    Args:
+        case_year: Year of the case (e.g., "2023")
+        case_name: Partial name of the case (e.g., "Acheson")
+        session: Session from make_session to use (defaults to get_session())
+        force_refresh: If True, bypasses the HTTP cache and re-fetches from Oyez
+    
+    Returns:
+        dict: Same keys as get_case_metadata
+    """
+    session = session or get_session()
+    
+    response = session.get(f'{OYEZ_API}/cases', params={'per_page': 0, 'filter': f'term:{case_year}'},
+                           force_refresh=force_refresh)
+    response.raise_for_status()
+    cases = response.json()
+    print(f"Found {len(cases)} cases for {case_year}")
+    
+    # Find the specific case we want; any word of case_name may match
+    needles = [word.lower() for word in case_name.split()]
+    titles = [case['name'].lower() for case in cases]
+    target_case = next(
+        (case for case, title in zip(cases, titles) if any(needle in title for needle in needles)),
+        None
+    )
+    
+    if target_case:
+        print(f"\nFound target case: {target_case['name']}")
+    else:
+        print("\nAvailable cases:")
+        for case in cases:
+            print(f"- {case['name']}")
+        raise Exception(f"Could not find case containing '{case_name}'. Please check the available cases listed above.")
+    
+    response = session.get(target_case['href'], force_refresh=force_refresh)
+    response.raise_for_status()
+    case = response.json()
+    
+    decided_by = case.get('decided_by') or {}
+    citation = case.get('citation') or {}
+    metadata = {
+        'title': case['name'],
+        'url': target_case['href'].replace(OYEZ_API, 'https://www.oyez.org'),
+        'description': case.get('description') or target_case.get('description'),
+        'petitioner': case.get('first_party'),
+        'respondent': case.get('second_party'),
+        'docket_no': case.get('docket_number'),
+        'decided_by': decided_by.get('name'),
+        'lower_court': (case.get('lower_court') or {}).get('name'),
+        'advocates': [
+            {
+                'name': advocate['advocate']['name'],
+                'role': advocate.get('advocate_description')
+            }
+            for advocate in case.get('advocates') or []
+            if advocate.get('advocate')
+        ],
+        'facts': _html_to_text(case.get('facts_of_the_case')),
+        'question': _html_to_text(case.get('question')),
+        'conclusion': _html_to_text(case.get('conclusion')),
+        'oral_argument_url': None,
+        'citation': None,
+    }
+    
+    # Point at the same player page the website links to, so the transcript
+    # scraper can load it exactly as it would the scraped iframe URL. The
+    # player URL needs the court, which undecided cases don't have yet; then
+    # the API URL is kept (it still ends with the audio id).
+    audio = (case.get('oral_argument_audio') or [None])[0]
+    if audio:
+        if decided_by.get('identifier'):
+            metadata['oral_argument_url'] = (
+                f"{PLAYER_URL}#/{decided_by['identifier']}/oral_argument_audio/{audio['id']}"
+            )
+        else:
+            metadata['oral_argument_url'] = audio.get('href') or f"{OYEZ_API}/case_media/oral_argument_audio/{audio['id']}"
+    
+    if citation.get('volume'):
+        metadata['citation'] = f"{citation['volume']} US {citation.get('page') or '__'} ({citation.get('year')})"
+    
+    # Timeline dates (Granted, Argued, Decided)
+    for event in case.get('timeline') or []:
+        if event and event.get('dates'):
+            metadata[event['event'].lower()] = _format_date(event['dates'][0])
+    
+    _print_metadata(metadata)
+    return metadata
+
+def get_case_metadata_from_page(driver, case_year, case_name):
+    """
+    Scrapes metadata for a Supreme Court case from the Oyez.org website
+    
+    Args:
+        driver: Selenium WebDriver instance
+        case_year: Year of the case (e.g., "2023")
+        case_name: Partial name of the case (e.g., "Acheson")
+    
+    Returns:
+        dict: Same keys as get_case_metadata
+    """
+    wait = WebDriverWait(driver, 20)
+    
     # First get metadata from the case list page
     driver.get(f'https://www.oyez.org/cases/{case_year}')
     print(f"Loading cases list page for {case_year}...")
-    time.sleep(5)
+    try:
+        wait.until(EC.presence_of_element_located(CASE_ITEMS_SEL))
+    except TimeoutException:
+        print("Timeout waiting for cases list")
     
-    # Find all case items
-    case_items = driver.find_elements(By.CSS_SELECTOR, 'li[ng-repeat*="case in pager.content"]')
-    print(f"Found {len(case_items)} cases")
+    # Read title, URL and description of all case items in one round trip
+    cases = driver.execute_script("""
+        return Array.from(document.querySelectorAll(arguments[0])).map(li => {
+            const link = li.querySelector('h2 a');
+            const description = li.querySelector('.description');
+            return {
+                title: link ? link.innerText.trim() : '',
+                url: link ? link.href : null,
+                description: description ? description.innerText.trim() : null
+            };
+        });
+    """, CASE_ITEMS_SEL[1])
+    print(f"Found {len(cases)} cases")
     
     # Print all case titles for debugging
     print("\nAvailable cases:")
-    for case in case_items:
-        try:
-            title = case.find_element(By.CSS_SELECTOR, 'h2 a').text.strip()
-            print(f"- {title}")
-        except:
-            continue
+    for case in cases:
+        if case['title']:
+            print(f"- {case['title']}")
     
-    # Find the specific case we want
-    target_case = None
-    for case in case_items:
-        try:
-            title = case.find_element(By.CSS_SELECTOR, 'h2 a').text.strip()
-            # Make the matching more flexible
-            if any(word.lower() in title.lower() for word in case_name.split()):
-                target_case = case
-                print(f"\nFound target case: {title}")
-                break
-        except Exception as e:
-            continue
+    # Find the specific case we want; any word of case_name may match
+    needles = [word.lower() for word in case_name.split()]
+    target_case = next(
+        (case for case in cases if any(needle in case['title'].lower() for needle in needles)),
+        None
+    )
     
     if not target_case:
         raise Exception(f"Could not find case containing '{case_name}'. Please check the available cases listed above.")
     
+    print(f"\nFound target case: {target_case['title']}")
     metadata = {}
     
     try:
-        # Get case title and URL from the found case
-        case_link = target_case.find_element(By.CSS_SELECTOR, 'h2 a')
-        metadata['title'] = case_link.text.strip()
-        case_url = case_link.get_attribute('href')
+        # Get case title, URL and description from the found case
+        metadata['title'] = target_case['title']
+        case_url = target_case['url']
         metadata['url'] = case_url
-        
-        # Get case description from list page
-        description = target_case.find_element(By.CSS_SELECTOR, '.description')
-        metadata['description'] = description.text.strip()
+        metadata['description'] = target_case['description']
         
         # Now navigate to the specific case page
         driver.get(case_url)
         print("Loading case details page...")
-        time.sleep(5)
+        try:
+            wait.until(EC.presence_of_element_located(CASE_DETAILS_SEL))
+        except TimeoutException:
+            print("Timeout waiting for case details")
+        
+        # Parse the rendered page once and query it in-process
+        root = lxml.html.fromstring(driver.page_source)
         
         # Get parties
         try:
-            parties = driver.find_element(By.CSS_SELECTOR, 'div.row:first-child')
-            metadata['petitioner'] = parties.find_element(By.XPATH, ".//div[h3[text()='Petitioner']]").text.replace('Petitioner', '').strip()
-            metadata['respondent'] = parties.find_element(By.XPATH, ".//div[h3[text()='Respondent']]").text.replace('Respondent', '').strip()
+            parties = PARTIES_SEL(root)[0]
+            metadata['petitioner'] = _element_text(PETITIONER_XPATH(parties)[0]).replace('Petitioner', '').strip()
+            metadata['respondent'] = _element_text(RESPONDENT_XPATH(parties)[0]).replace('Respondent', '').strip()
         except Exception as e:
             print(f"Error getting parties: {e}")
         
         # Get case details
         try:
-            metadata['docket_no'] = driver.find_element(By.XPATH, "//div[h3[text()='Docket no.']]/text()").strip()
-            metadata['decided_by'] = driver.find_element(By.XPATH, "//div[h3[text()='Decided by']]//a").text.strip()
-            metadata['lower_court'] = driver.find_element(By.XPATH, "//div[h3[text()='Lower court']]").text.replace('Lower court', '').strip()
+            metadata['docket_no'] = ''.join(DOCKET_NO_XPATH(root)).strip()
+            metadata['decided_by'] = _element_text(DECIDED_BY_XPATH(root)[0])
+            metadata['lower_court'] = _element_text(LOWER_COURT_XPATH(root)[0]).replace('Lower court', '').strip()
         except Exception as e:
             print(f"Error getting case details: {e}")
         
         # Get advocates
         try:
-            advocates_section = driver.find_element(By.CSS_SELECTOR, 'div.subcell[ng-if="case.advocates"]')
-            advocates = []
-            for advocate in advocates_section.find_elements(By.CSS_SELECTOR, '.advocate'):
-                name = advocate.find_element(By.CSS_SELECTOR, 'a').text.strip()
-                role = advocate.find_element(By.CSS_SELECTOR, '.description').text.strip()
-                advocates.append({
-                    'name': name,
-                    'role': role
-                })
-            metadata['advocates'] = advocates
+            metadata['advocates'] = [
+                {
+                    'name': _element_text(LINK_SEL(advocate)[0]),
+                    'role': _element_text(DESCRIPTION_SEL(advocate)[0])
+                }
+                for advocate in ADVOCATES_SEL(root)
+            ]
         except Exception as e:
             print(f"Error getting advocates: {e}")
         
-        # Get facts of the case
-        try:
-            facts_section = driver.find_element(By.CSS_SELECTOR, 'section.abstract[ng-if="case.facts_of_the_case"]')
-            facts_paragraphs = facts_section.find_elements(By.CSS_SELECTOR, 'div.ng-binding p')
-            metadata['facts'] = '\n\n'.join([p.text.strip() for p in facts_paragraphs])
-        except Exception as e:
-            print(f"Error getting facts: {e}")
-        
-        # Get question presented
-        try:
-            question_section = driver.find_element(By.CSS_SELECTOR, 'section.abstract[ng-if="case.question"]')
-            question_paragraphs = question_section.find_elements(By.CSS_SELECTOR, 'div.ng-binding p')
-            metadata['question'] = '\n\n'.join([p.text.strip() for p in question_paragraphs])
-        except Exception as e:
-            print(f"Error getting question: {e}")
-        
-        # Get conclusion
-        try:
-            conclusion_section = driver.find_element(By.CSS_SELECTOR, 'section.abstract div[ng-if="case.conclusion"]')
-            conclusion_paragraphs = conclusion_section.find_elements(By.CSS_SELECTOR, 'p')
-            metadata['conclusion'] = '\n\n'.join([p.text.strip() for p in conclusion_paragraphs])
-        except Exception as e:
-            print(f"Error getting conclusion: {e}")
+        # Get facts of the case, question presented and conclusion
+        metadata['facts'] = '\n\n'.join(_element_text(p) for p in FACTS_SEL(root))
+        metadata['question'] = '\n\n'.join(_element_text(p) for p in QUESTION_SEL(root))
+        metadata['conclusion'] = '\n\n'.join(_element_text(p) for p in CONCLUSION_SEL(root))
         
         # Add oral argument URL
-        try:
-            # Look for the oral argument link with the specific attributes
-            oral_argument_link = driver.find_element(
-                By.CSS_SELECTOR, 
-                'a[data-gtm-category="Audios"][data-gtm-type="click"][iframe-url*="oral_argument_audio"]'
-            )
+        # Look for the oral argument link with the specific attributes, then
+        # for any link containing oral_argument_audio in the iframe-url
+        oral_argument_links = ORAL_ARG_SEL(root) or ORAL_ARG_FALLBACK_SEL(root)
+        if oral_argument_links:
             # Get the iframe URL which contains the actual player URL
-            iframe_url = oral_argument_link.get_attribute('iframe-url')
+            iframe_url = oral_argument_links[0].get('iframe-url')
             metadata['oral_argument_url'] = iframe_url
             print(f"Found oral argument URL: {iframe_url}")
-        except Exception as e:
-            print(f"Error getting oral argument URL: {e}")
-            # Try alternative method
-            try:
-                # Look for any link containing oral_argument_audio in the iframe-url
-                oral_argument_link = driver.find_element(
-                    By.CSS_SELECTOR,
-                    'a[iframe-url*="oral_argument_audio"]'
-                )
-                iframe_url = oral_argument_link.get_attribute('iframe-url')
-                metadata['oral_argument_url'] = iframe_url
-                print(f"Found oral argument URL (alternative method): {iframe_url}")
-            except Exception as e2:
-                print(f"Error getting oral argument URL (alternative method): {e2}")
-                metadata['oral_argument_url'] = None
+        else:
+            print("Error getting oral argument URL: no oral argument link found")
+            metadata['oral_argument_url'] = None
             
         # Get case details from the timeline section
         try:
-            timeline_section = driver.find_element(By.CSS_SELECTOR, 'div.cell:has(div.subcell)')
+            timeline_section = next(cell for cell in CELL_SEL(root) if SUBCELL_SEL(cell))
             
             # Get citation
-            try:
-                citation_element = timeline_section.find_element(
-                    By.CSS_SELECTOR, 
-                    'div.subcell[ng-if="case.citation"] span.ng-binding'
-                )
-                metadata['citation'] = citation_element.text.strip()
-            except Exception as e:
-                print(f"Error getting citation: {e}")
-                metadata['citation'] = None
+            citation_elements = CITATION_SEL(timeline_section)
+            metadata['citation'] = _element_text(citation_elements[0]) if citation_elements else None
             
             # Get timeline dates (Granted, Argued, Decided)
-            timeline_items = timeline_section.find_elements(
-                By.CSS_SELECTOR, 
-                'div.subcell.ng-binding.ng-scope'
-            )
-            
-            for item in timeline_items:
-                try:
-                    # Get the header (Granted, Argued, or Decided)
-                    header = item.find_element(By.CSS_SELECTOR, 'h3').text.strip().lower()
-                    # Get the date
-                    date = item.find_element(By.CSS_SELECTOR, 'div.ng-binding.ng-scope').text.strip()
-                    metadata[header] = date
-                except Exception as e:
-                    print(f"Error getting {header} date: {e}")
-                    metadata[header] = None
+            for item in TIMELINE_ITEMS_SEL(timeline_section):
+                headers = TIMELINE_HEADER_SEL(item)
+                dates = TIMELINE_DATE_SEL(item)
+                if headers:
+                    metadata[_element_text(headers[0]).lower()] = _element_text(dates[0]) if dates else None
                     
-        except Exception as e:
-            print(f"Error getting timeline details: {e}")
+        except StopIteration:
+            print("Error getting timeline details: no timeline section found")
         
     except Exception as e:
         print(f"Error getting specific metadata: {e}")
     
-    print("\nMetadata found:")
-    for key, value in metadata.items():
-        if isinstance(value, list):
-            print(f"\n{key}:")
-            for item in value:
-                print(f"  - {item}")
-        else:
-            print(f"{key}: {value}")
-    
+    _print_metadata(metadata)
     return metadata
 
-def get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", full_transcript=False):
+def get_transcript_from_api(oral_argument_url, full_transcript=False, session=None, force_refresh=False):
+    """
+    Gets the oral argument transcript from the Oyez JSON API
+    
+    The player page only renders what api.oyez.org/case_media/oral_argument_audio
+    already returns, so no browser is needed unless that endpoint fails.
+    If the endpoint answers but has no transcript (e.g. the audio is posted
+    before the transcript), the player page has none either, so this raises
+    instead of asking for the page fallback.
+    
+    Args:
+        oral_argument_url: Player URL from the case metadata (ends with the audio id)
+        full_transcript: If True, gets entire transcript. If False, gets first 3 blocks (test mode)
+        session: Session from make_session to use (defaults to get_session())
+        force_refresh: If True, bypasses the HTTP cache and re-fetches from Oyez
+    
+    Returns:
+        list: Transcript entries (speaker, text, start_time, stop_time), or
+        None if the API request failed and the player page should be scraped
+    """
+    session = session or get_session()
+    
+    match = re.search(r'oral_argument_audio/(\d+)', oral_argument_url)
+    if not match:
+        return None
+    
+    try:
+        response = session.get(f'{OYEZ_API}/case_media/oral_argument_audio/{match.group(1)}',
+                               force_refresh=force_refresh)
+        response.raise_for_status()
+        media = response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error getting transcript from API: {e}")
+        return None
+    
+    if not media.get('transcript'):
+        raise Exception("No transcript is available for this oral argument yet")
+    
+    # Pair every text block with the speaker of its turn
+    blocks = []
+    current_speaker = None
+    for section in media['transcript'].get('sections') or []:
+        for turn in section.get('turns') or []:
+            if turn.get('speaker'):
+                current_speaker = turn['speaker']['name']
+            for text_block in turn.get('text_blocks') or []:
+                blocks.append((current_speaker, text_block))
+    
+    # Same order as scrape_transcript_page: take the blocks, then drop empty ones
+    if not full_transcript:
+        print("Getting first 3 blocks only (TEST MODE)")
+        blocks = blocks[:3]  # Get only first 3 blocks for testing
+    
+    transcript = [
+        {
+            'speaker': speaker,
+            'text': text_block['text'].strip(),
+            'start_time': _to_seconds(text_block.get('start')),
+            'stop_time': _to_seconds(text_block.get('stop'))
+        }
+        for speaker, text_block in blocks
+        if speaker and (text_block.get('text') or '').strip()
+    ]
+    
+    print(f"Got {len(transcript)} transcript entries from API")
+    return transcript
+
+def scrape_transcript_page(driver, oral_argument_url, full_transcript=False):
+    """
+    Scrapes the transcript blocks from an Oyez oral argument player page
+    
+    Args:
+        driver: Selenium WebDriver instance
+        oral_argument_url: Player URL from the case metadata
+        full_transcript: If True, gets entire transcript. If False, gets first 3 blocks (test mode)
+    
+    Returns:
+        tuple: (transcript, complete) where transcript is the list of entries
+        (speaker, text, start_time, stop_time) and complete is False if some
+        blocks were still empty when the wait for their text timed out
+    """
+    # Load the transcript page
+    driver.get(oral_argument_url)
+    print("\nLoading transcript page...")
+    
+    # Poll in small steps until the text blocks are present
+    try:
+        blocks = WebDriverWait(driver, 30, poll_frequency=0.25).until(
+            lambda d: d.find_elements(*BLOCKS_SEL) or False
+        )
+    except TimeoutException:
+        raise Exception("Could not load transcript blocks within 30 seconds")
+    print(f"Found {len(blocks)} transcript blocks")
+    
+    # TRANSCRIPT CONTROL
+    # To get the full transcript, set full_transcript=True when calling this function
+    # Example: get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", full_transcript=True)
+    if not full_transcript:
+        print("Getting first 3 blocks only (TEST MODE)")
+        blocks = blocks[:3]  # Get only first 3 blocks for testing
+    else:
+        print(f"Getting all {len(blocks)} blocks (FULL TRANSCRIPT MODE)")
+    
+    transcript = []
+    current_speaker = None
+    
+    # Click the blocks to reveal their text (required by Oyez's interface).
+    # All clicks run inside the browser in one call, then we poll once
+    # until Angular has filled in every clicked block.
+    driver.execute_script("""
+        Array.from(document.querySelectorAll(arguments[0]))
+            .slice(0, arguments[1]).forEach(p => p.click());
+    """, BLOCKS_SEL[1], len(blocks))
+    complete = True
+    try:
+        WebDriverWait(driver, 30).until(lambda d: d.execute_script("""
+            return Array.from(document.querySelectorAll(arguments[0]))
+                .slice(0, arguments[1]).every(p => p.innerText.trim().length > 0);
+        """, BLOCKS_SEL[1], len(blocks)))
+    except TimeoutException:
+        # Some blocks may just be empty; keep what loaded, empty blocks are skipped below
+        print("Timeout waiting for transcript text, keeping the blocks loaded so far")
+        complete = False
+    
+    # Read text, timing and speaker of every block in one round trip
+    # instead of several WebDriver calls per block, along with the first
+    # speaker label on the page as a fallback
+    page = driver.execute_script("""
+        const first = document.querySelector(arguments[1]);
+        return {
+            first_speaker: first ? first.textContent.trim() : null,
+            blocks: Array.from(document.querySelectorAll(arguments[0]))
+                .slice(0, arguments[2]).map(p => {
+                    const turn = p.closest('.transcript-turn');
+                    const label = turn && turn.querySelector(arguments[1]);
+                    return {
+                        text: p.innerText.trim(),
+                        start: p.getAttribute('start-time'),
+                        stop: p.getAttribute('stop-time'),
+                        speaker: label ? label.textContent.trim() : null
+                    };
+                })
+        };
+    """, BLOCKS_SEL[1], SPEAKER_SEL[1], len(blocks))
+    entries = page['blocks']
+    
+    for i, item in enumerate(entries):
+        text = item['text']
+        logger.debug("Block %d/%d text: %.100s", i + 1, len(entries), text)
+        
+        if item['speaker']:
+            current_speaker = item['speaker']
+        elif not current_speaker:
+            # Fallback: use the first speaker on the page if none found
+            current_speaker = page['first_speaker']
+        
+        if text and current_speaker:
+            entry = {
+                'speaker': current_speaker,
+                'text': text,
+                'start_time': _to_seconds(item['start']),
+                'stop_time': _to_seconds(item['stop'])
+            }
+            transcript.append(entry)
+            if i % 50 == 0:  # Log progress every 50 blocks
+                logger.info("Progress: %d/%d blocks processed", i + 1, len(entries))
+    
+    return transcript, complete
+
+def save_result(metadata, transcript, full_transcript=False):
+    """Writes the metadata and transcript of a case to its JSON output file and returns the filename."""
+    mode_suffix = '_test' if not full_transcript else '_full'
+    
+    # Create result with mode indicator
+    result = {
+        'case_name': metadata['title'],
+        'argument_date': metadata.get('argued'),
+        'metadata': metadata,
+        'transcript': transcript,
+        'transcript_mode': 'TEST (first 3 blocks)' if not full_transcript else 'FULL'
+    }
+    
+    # Save to file
+    safe_case_name = metadata['title'].replace(' ', '_').replace(',', '').replace('.', '').replace('v', 'v')
+    filename = f'{safe_case_name}_transcript{mode_suffix}.json'
+    
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    
+    print(f"\nSaved {len(transcript)} transcript entries to {filename}")
+    
+    return filename
+
+def create_driver(headed=False):
+    """
+    Starts the Chrome WebDriver used for page scraping
+    
+    Chrome runs headless and returns from driver.get at DOMContentLoaded;
+    the scrapers wait for the elements they need themselves. Pass
+    headed=True to get a visible browser, e.g. if Oyez serves the headless
+    browser different content.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--window-size=1920,1080")
+    if not headed:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--no-sandbox")
+    
+    # Skip first-run setup, background services and logging on start-up
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
+    service = Service(service_args=['--log-level=OFF'], log_output=os.devnull)
+    
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    
+    # Block images, fonts, media and trackers on every page load
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    
+    return driver
+
+class _LazyDriver:
+    """
+    Starts a Chrome WebDriver on the first call and returns the same one
+    afterwards; uses counts the calls since the driver was started.
+    """
+    
+    def __init__(self, headed=False):
+        self.headed = headed
+        self.driver = None
+        self.uses = 0
+    
+    def __call__(self):
+        if self.driver is None:
+            self.driver = create_driver(self.headed)
+        self.uses += 1
+        return self.driver
+    
+    def quit(self):
+        """Quits the driver, if started; the next call starts a new one."""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                # A crashed browser can fail to quit; it is dropped either way
+                print(f"Error quitting Chrome: {e}")
+            self.driver = None
+        self.uses = 0
+
+@contextmanager
+def chrome_pool(n, headed=False):
+    """Starts n Chrome WebDrivers up front and quits them all on exit."""
+    drivers = []
+    try:
+        for _ in range(n):
+            drivers.append(create_driver(headed))
+        yield drivers
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+def get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", full_transcript=False,
+                                 force_refresh=False, headed=False, driver=None):
     """
     Scrapes oral argument transcript from Oyez.org
     
@@ -220,6 +752,11 @@ def get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", f
         case_name: Partial name of the case (e.g., "Acheson")
         full_transcript: If True, gets entire transcript. If False, gets first 3 blocks (test mode)
                         The output filename will include '_test' or '_full' accordingly
+        force_refresh: If True, ignores responses and transcripts cached by a previous run
+        headed: If True, shows the Chrome window instead of running headless
+        driver: Existing WebDriver (or function returning one) to reuse for page
+                scraping. It is left running; when None, one is started if needed
+                and quit at the end
     
     Output:
         Saves a JSON file containing:
@@ -227,22 +764,25 @@ def get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", f
         - Transcript entries with:
             - speaker: Name of the speaker
             - text: What was said
-            - start_time/stop_time: Timing information
+            - start_time/stop_time: Timing information (seconds)
     
     Note:
-        - The script handles Oyez's dynamic loading by clicking each text block
-        - Uses retries and waits to ensure content loads properly
+        - Metadata and transcript come from the Oyez JSON API; Chrome is only
+          started if the API fails and the website has to be scraped instead
+        - The page scraper handles Oyez's dynamic loading by clicking each text block
         - Saves progress information to console
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    wait = WebDriverWait(driver, 20)
+    own_driver = None
+    if driver is None:
+        get_driver = own_driver = _LazyDriver(headed)
+    elif callable(driver):
+        get_driver = driver
+    else:
+        get_driver = lambda: driver
     
     try:
         # First get the case metadata
-        metadata = get_case_metadata(driver, case_year, case_name)
+        metadata = get_case_metadata(get_driver, case_year, case_name, force_refresh=force_refresh)
         
         # Get the oral argument URL from metadata
         oral_argument_url = metadata.get('oral_argument_url')
@@ -250,123 +790,115 @@ def get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", f
             print("No oral argument URL found")
             return
             
-        # Load the transcript page
-        driver.get(oral_argument_url)
-        print("\nLoading transcript page...")
-        time.sleep(5)  # Initial wait
-        
-        # Wait for at least one text block to be present
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'p.ng-binding.ng-scope.ng-isolate-scope')))
-            print("Initial transcript block found")
-        except Exception as e:
-            print("Timeout waiting for transcript blocks, trying longer wait...")
-            time.sleep(10)  # Extra wait if needed
-        
-        # Get text blocks with retry
-        max_retries = 3
-        for attempt in range(max_retries):
-            blocks = driver.find_elements(By.CSS_SELECTOR, 'p.ng-binding.ng-scope.ng-isolate-scope')
-            if blocks:
-                print(f"Found {len(blocks)} transcript blocks")
-                break
-            else:
-                print(f"Attempt {attempt + 1}: No transcript blocks found, waiting...")
-                time.sleep(5)
-        
-        if not blocks:
-            raise Exception("Could not load transcript blocks after multiple attempts")
-        
-        # TRANSCRIPT CONTROL
-        # To get the full transcript, set full_transcript=True when calling this function
-        # Example: get_transcript_with_selenium(case_year="2023", case_name="Acheson Hotels", full_transcript=True)
-        if not full_transcript:
-            print("Getting first 3 blocks only (TEST MODE)")
-            blocks = blocks[:3]  # Get only first 3 blocks for testing
-        else:
-            print(f"Getting all {len(blocks)} blocks (FULL TRANSCRIPT MODE)")
-        
-        transcript = []
-        current_speaker = None
-        
-        for i, block in enumerate(blocks):
-            try:
-                # Click block to reveal text (required by Oyez's interface)
-                driver.execute_script("arguments[0].click();", block)
-                time.sleep(0.1)  # Reduced from 0.2 to 0.1 seconds
-                
-                text = block.text.strip()
-                print(f"\nBlock {i+1}/{len(blocks)} text: {text[:100]}")
-                
-                start_time = block.get_attribute('start-time')
-                stop_time = block.get_attribute('stop-time')
-                
-                # Find the speaker for this block
-                speaker = driver.execute_script("""
-                    function findSpeaker(element) {
-                        let turn = element.closest('.transcript-turn');
-                        if (turn) {
-                            let label = turn.querySelector('h4.ng-binding');
-                            if (label) {
-                                return label.textContent;
-                            }
-                        }
-                        return null;
-                    }
-                    return findSpeaker(arguments[0]);
-                """, block)
-                
-                if speaker:
-                    current_speaker = speaker.strip()
-                elif not current_speaker:
-                    # Fallback: try to find any speaker if none found
-                    speakers = driver.find_elements(By.CSS_SELECTOR, 'h4.ng-binding')
-                    if speakers:
-                        current_speaker = speakers[0].text.strip()
-                
-                if text and current_speaker:
-                    entry = {
-                        'speaker': current_speaker,
-                        'text': text,
-                        'start_time': start_time,
-                        'stop_time': stop_time
-                    }
-                    transcript.append(entry)
-                    if i % 10 == 0:  # Print progress every 10 blocks
-                        print(f"Progress: {i+1}/{len(blocks)} blocks processed")
-            
-            except Exception as e:
-                print(f"Error processing block {i+1}: {e}")
-                continue
+        mode_suffix = '_test' if not full_transcript else '_full'
+        docket_no = metadata.get('docket_no')
         
-        # Create result with mode indicator
-        result = {
-            'case_name': metadata['title'],
-            'argument_date': metadata.get('argued'),
-            'metadata': metadata,
-            'transcript': transcript,
-            'transcript_mode': 'TEST (first 3 blocks)' if not full_transcript else 'FULL'
-        }
+        transcript = None
+        if docket_no and not force_refresh:
+            transcript = load_cached_transcript(case_year, docket_no, mode_suffix)
+            if transcript is not None:
+                print(f"\nLoaded {len(transcript)} transcript entries from cache")
         
-        # Save to file
-        safe_case_name = metadata['title'].replace(' ', '_').replace(',', '').replace('.', '').replace('v', 'v')
-        mode_suffix = '_test' if not full_transcript else '_full'
-        filename = f'{safe_case_name}_transcript{mode_suffix}.json'
+        if transcript is None:
+            transcript = get_transcript_from_api(oral_argument_url, full_transcript, force_refresh=force_refresh)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if transcript is None:
+            # Only the player page renders a transcript; for undecided cases
+            # oral_argument_url is the API URL, which has nothing to scrape
+            if not oral_argument_url.startswith(PLAYER_URL):
+                raise Exception("Transcript not available from API and there is no player page to scrape")
+            print("Transcript not available from API, falling back to page scraping...")
+            transcript, complete = scrape_transcript_page(get_driver(), oral_argument_url, full_transcript)
+            # Don't let reruns reuse a transcript that may be missing blocks
+            if docket_no and complete:
+                save_cached_transcript(case_year, docket_no, mode_suffix, transcript)
         
-        print(f"\nSaved {len(transcript)} transcript entries to {filename}")
+        save_result(metadata, transcript, full_transcript)
         
+    except WebDriverException as e:
+        print(f"Error: {e}")
+        # Chrome may have crashed; don't hand the same driver to the next case
+        if isinstance(get_driver, _LazyDriver) and not isinstance(e, TimeoutException):
+            get_driver.quit()
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        driver.quit()
+        if own_driver:
+            own_driver.quit()
+
+def get_transcripts_with_selenium(cases, full_transcript=False, force_refresh=False, headed=False):
+    """
+    Runs get_transcript_with_selenium for several cases on one Chrome instance
+    
+    Chrome is only started once a case has to fall back to page scraping,
+    and is then shared by all later cases; it is restarted after
+    DRIVER_RECYCLE_AFTER page scrapes.
+    
+    Args:
+        cases: List of (case_year, case_name) tuples
+        full_transcript, force_refresh, headed: As for get_transcript_with_selenium
+    """
+    get_driver = _LazyDriver(headed)
+    try:
+        for case_year, case_name in cases:
+            if get_driver.uses >= DRIVER_RECYCLE_AFTER:
+                get_driver.quit()
+            get_transcript_with_selenium(case_year, case_name, full_transcript, force_refresh,
+                                         headed=headed, driver=get_driver)
+    finally:
+        get_driver.quit()
+
+def _scrape_one(session, case_year, case_name, full_transcript=False):
+    time.sleep(REQUEST_DELAY)
+    try:
+        metadata = get_case_metadata_from_api(case_year, case_name, session=session)
+        if not metadata.get('oral_argument_url'):
+            print(f"No oral argument URL found for {metadata['title']}")
+            return None
+        
+        transcript = get_transcript_from_api(metadata['oral_argument_url'], full_transcript, session=session)
+        if transcript is None:
+            print(f"Transcript not available from API for {metadata['title']}")
+            return None
+        
+        return save_result(metadata, transcript, full_transcript)
+    except Exception as e:
+        print(f"Error scraping {case_name} ({case_year}): {e}")
+        return None
+
+def scrape_cases(cases, max_workers=8, full_transcript=False):
+    """
+    Scrapes several cases in parallel from the Oyez JSON API
+    
+    Each case is a few independent HTTP requests, so the cases are spread
+    over a thread pool sharing one Session sized to the pool.
+    
+    Args:
+        cases: List of (case_year, case_name) tuples
+        max_workers: Number of cases fetched at the same time
+        full_transcript: If True, gets entire transcripts. If False, gets first 3 blocks (test mode)
+    
+    Returns:
+        list: Output filename for each case, or None where it failed
+    """
+    session = make_session(pool_maxsize=max_workers)
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(_scrape_one, session, case_year, case_name, full_transcript)
+            for case_year, case_name in cases
+        ]
+        return [future.result() for future in futures]
 
 if __name__ == "__main__":
+    # Per-block output is logged at DEBUG; set level=logging.DEBUG to see it
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Single case processing
     get_transcript_with_selenium(
         case_year="2023",
         case_name="Acheson",  # Just need part of the name
         full_transcript=False
-    )
\ No newline at end of file
+    )
+    
+    # Multiple cases can be fetched in parallel from the API, e.g.:
+    # scrape_cases([("2023", "Acheson"), ("2023", "Loper Bright")], full_transcript=True)
\ No newline at end of file